@@ -432,6 +432,8 @@ class GrammarCompiler::Impl {
 
   CompiledGrammar CompileGrammar(const Grammar& grammar);
 
+  CompiledGrammar CompileGrammar(const std::string& ebnf_str, const std::string& root_rule_name);
+
   void ClearCache();
 
   long long GetCacheSizeBytes() const;
@@ -682,6 +684,18 @@ CompiledGrammar GrammarCompiler::Impl::CompileGrammar(const Grammar& grammar) {
   return compile_cache_.Get(key);
 }
 
+CompiledGrammar GrammarCompiler::Impl::CompileGrammar(
+    const std::string& ebnf_str, const std::string& root_rule_name
+) {
+  if (!cache_enabled_) {
+    return MultiThreadCompileGrammar(Grammar::FromEBNF(ebnf_str, root_rule_name));
+  }
+  // GrammarKey is computed by parsing the string with Grammar::FromEBNF, so the raw EBNF string
+  // can be used as the key directly, and parsing is skipped on cache hits.
+  auto key = std::make_pair(ebnf_str, root_rule_name);
+  return compile_cache_.Get(key);
+}
+
 void GrammarCompiler::Impl::ClearCache() {
   compile_builtin_json_grammar_cache_.Clear();
   compile_cache_.Clear();
@@ -740,6 +754,12 @@ CompiledGrammar GrammarCompiler::CompileGrammar(const Grammar& grammar) {
   return pimpl_->CompileGrammar(grammar);
 }
 
+CompiledGrammar GrammarCompiler::CompileGrammar(
+    const std::string& ebnf_str, const std::string& root_rule_name
+) {
+  return pimpl_->CompileGrammar(ebnf_str, root_rule_name);
+}
+
 void GrammarCompiler::ClearCache() { pimpl_->ClearCache(); }
 
 long long GrammarCompiler::GetCacheSizeBytes() const { return pimpl_->GetCacheSizeBytes(); }
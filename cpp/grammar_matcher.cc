@@ -8,6 +8,12 @@
 
 #include <xgrammar/matcher.h>
 
+#include <cstring>
+#include <list>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
 #include "compiled_grammar_data_structure.h"
 #include "grammar_data_structure.h"
 #include "grammar_matcher_base.h"
@@ -253,7 +259,8 @@ class GrammarMatcher::Impl : public GrammarMatcherBase {
       const CompiledGrammar& compiled_grammar,
       std::optional<std::vector<int>> override_stop_tokens = std::nullopt,
       bool terminate_without_stop_token = false,
-      int max_rollback_tokens = 0
+      int max_rollback_tokens = 0,
+      int bitmask_cache_size = 0
   )
       : GrammarMatcherBase(compiled_grammar->grammar),
         compiled_grammar_(compiled_grammar),
@@ -261,9 +268,11 @@ class GrammarMatcher::Impl : public GrammarMatcherBase {
         stop_token_ids_(override_stop_tokens.value_or(tokenizer_info_.GetStopTokenIds())),
         terminate_without_stop_token_(terminate_without_stop_token),
         max_rollback_tokens_(max_rollback_tokens),
+        bitmask_cache_size_(bitmask_cache_size),
         tmp_accepted_bitset_(tokenizer_info_.GetVocabSize()) {
     XGRAMMAR_CHECK(!override_stop_tokens.has_value() || !override_stop_tokens->empty())
         << "The override_stop_tokens should not be empty";
+    XGRAMMAR_CHECK(bitmask_cache_size >= 0) << "The bitmask_cache_size should be non-negative";
   }
 
   bool AcceptToken(int32_t token_id, bool debug_print = false);
@@ -306,8 +315,24 @@ class GrammarMatcher::Impl : public GrammarMatcherBase {
       const std::vector<bool>& uncertain_tokens_bitset
   );
 
-  /*! \brief Set the acceptable next token in next_token_bitmask. */
-  void SetTokenBitmask(
+  /*!
+   * \brief Compute the next token bitmask from the latest stack tops and write it to
+   * bitmask_data_ptr.
+   * \returns Whether the bitmask needs to be applied (not all-true).
+   */
+  bool ComputeNextTokenBitmask(int32_t* bitmask_data_ptr, int index, bool debug_print);
+
+  /*!
+   * \brief Serialize all stacks of the latest stack tops into tmp_bitmask_cache_key_. Node ids
+   * are excluded, so the same matching state always gives the same key.
+   */
+  void BuildBitmaskCacheKey();
+
+  /*!
+   * \brief Set the acceptable next token in next_token_bitmask.
+   * \returns Whether the bitmask rejects some tokens, i.e. whether it needs to be applied.
+   */
+  bool SetTokenBitmask(
       int32_t* bitmask_data_ptr,
       const DynamicBitset& accepted_bitset,
       const std::vector<int32_t>& rejected_indices,
@@ -323,9 +348,6 @@ class GrammarMatcher::Impl : public GrammarMatcherBase {
 
   bool IsStopTokenAccepted() const;
 
-  /*! \brief Check if the token bitmask is all-true. */
-  bool IsTokenBitmaskAllTrue(int32_t* bitmask_data_ptr);
-
   std::string PrintBitmask(int32_t* bitmask_data_ptr, const TokenizerInfo& tokenizer_info);
 
   CompiledGrammar compiled_grammar_;
@@ -333,12 +355,24 @@ class GrammarMatcher::Impl : public GrammarMatcherBase {
   std::vector<int> stop_token_ids_;
   bool terminate_without_stop_token_;
   int max_rollback_tokens_;
+  int bitmask_cache_size_;
   std::deque<int> token_length_history;
 
   // Temporary data for FillNextTokenBitmask. They are stored here to avoid repeated allocation.
   DynamicBitset tmp_accepted_bitset_;
   std::vector<int32_t> tmp_rejected_indices_;
   std::vector<int32_t> tmp_rejected_indices_delta_;
+
+  /*!
+   * \brief The LRU cache of filled bitmasks. The key is the serialized stacks of the matching
+   * state (see BuildBitmaskCacheKey), and the value is the bitmask and whether it needs to be
+   * applied. The bitmask only depends on the stacks, so revisiting a state, e.g. inside a long
+   * JSON string, only needs a memcpy. It holds at most bitmask_cache_size_ entries.
+   */
+  using BitmaskCacheEntry = std::pair<std::vector<int32_t>, std::pair<std::vector<int32_t>, bool>>;
+  std::list<BitmaskCacheEntry> bitmask_cache_list_;
+  std::unordered_map<std::vector<int32_t>, std::list<BitmaskCacheEntry>::iterator> bitmask_cache_;
+  std::vector<int32_t> tmp_bitmask_cache_key_;
 };
 
 bool GrammarMatcher::Impl::AcceptStopToken() {
@@ -485,13 +519,6 @@ std::string GrammarMatcher::Impl::PrintBitmask(
   return ss.str();
 }
 
-bool GrammarMatcher::Impl::IsTokenBitmaskAllTrue(int32_t* bitmask_data_ptr) {
-  DynamicBitset next_token_bitset(
-      tokenizer_info_.GetVocabSize(), reinterpret_cast<uint32_t*>(bitmask_data_ptr)
-  );
-  return next_token_bitset.All();
-}
-
 bool GrammarMatcher::Impl::FillNextTokenBitmask(
     DLTensor* next_token_bitmask, int index, bool debug_print
 ) {
@@ -500,7 +527,62 @@ bool GrammarMatcher::Impl::FillNextTokenBitmask(
          "find the next token mask";
   int32_t* bitmask_data_ptr =
       CheckAndGetBitmaskPtr(*next_token_bitmask, tokenizer_info_.GetVocabSize(), index);
+  int buffer_size = GetBitmaskSize(tokenizer_info_.GetVocabSize());
+
+  // The cache is bypassed when debug_print is set so that the matching process is printed
+  if (debug_print || bitmask_cache_size_ == 0) {
+    return ComputeNextTokenBitmask(bitmask_data_ptr, index, debug_print);
+  }
+
+  BuildBitmaskCacheKey();
+  auto cache_it = bitmask_cache_.find(tmp_bitmask_cache_key_);
+  if (cache_it != bitmask_cache_.end()) {
+    bitmask_cache_list_.splice(bitmask_cache_list_.begin(), bitmask_cache_list_, cache_it->second);
+    const auto& [cached_bitmask, need_apply] = cache_it->second->second;
+    std::memcpy(bitmask_data_ptr, cached_bitmask.data(), buffer_size * sizeof(int32_t));
+    return need_apply;
+  }
+
+  bool need_apply = ComputeNextTokenBitmask(bitmask_data_ptr, index, debug_print);
+
+  if (static_cast<int>(bitmask_cache_list_.size()) >= bitmask_cache_size_) {
+    bitmask_cache_.erase(bitmask_cache_list_.back().first);
+    bitmask_cache_list_.pop_back();
+  }
+  bitmask_cache_list_.emplace_front(
+      tmp_bitmask_cache_key_,
+      std::make_pair(
+          std::vector<int32_t>(bitmask_data_ptr, bitmask_data_ptr + buffer_size), need_apply
+      )
+  );
+  bitmask_cache_.emplace(tmp_bitmask_cache_key_, bitmask_cache_list_.begin());
+  return need_apply;
+}
+
+void GrammarMatcher::Impl::BuildBitmaskCacheKey() {
+  tmp_bitmask_cache_key_.clear();
+  for (auto top : stack_tops_history_.GetLatest()) {
+    for (auto id = top; id != StackElement::kNoParent; id = persistent_stack_[id].parent_id) {
+      const auto& stack_element = persistent_stack_[id];
+      tmp_bitmask_cache_key_.insert(
+          tmp_bitmask_cache_key_.end(),
+          {stack_element.rule_id,
+           stack_element.sequence_id,
+           stack_element.element_id,
+           stack_element.left_utf8_bytes,
+           stack_element.element_in_string}
+      );
+    }
+    // Separate the stacks
+    tmp_bitmask_cache_key_.push_back(-1);
+  }
+}
+
+bool GrammarMatcher::Impl::ComputeNextTokenBitmask(
+    int32_t* bitmask_data_ptr, int index, bool debug_print
+) {
   const auto& sorted_decoded_vocab = tokenizer_info_.GetSortedDecodedVocab();
+  const auto& sorted_token_ids = tokenizer_info_.GetSortedTokenIds();
   const auto& adaptive_token_mask_cache = compiled_grammar_->adaptive_token_mask_cache;
   const auto& latest_stack_tops = stack_tops_history_.GetLatest();
 
@@ -605,7 +687,7 @@ bool GrammarMatcher::Impl::FillNextTokenBitmask(
       if (adaptive_token_mask.store_type == StoreType::kAcceptedBitset ||
           adaptive_token_mask.store_type == StoreType::kAccepted) {
         if (accepted) {
-          tmp_accepted_bitset_.Set(sorted_decoded_vocab[cur_token_idx].first, true);
+          tmp_accepted_bitset_.Set(sorted_token_ids[cur_token_idx], true);
         }
       } else {
         if (!accepted) {
@@ -623,7 +705,7 @@ bool GrammarMatcher::Impl::FillNextTokenBitmask(
       tmp_accepted_bitset_ |= adaptive_token_mask.accepted_bitset;
     } else if (adaptive_token_mask.store_type == StoreType::kAccepted) {
       for (auto idx : adaptive_token_mask.accepted_indices) {
-        tmp_accepted_bitset_.Set(sorted_decoded_vocab[idx].first, true);
+        tmp_accepted_bitset_.Set(sorted_token_ids[idx], true);
       }
     } else {
       // rejected_indices = Intersect(
@@ -636,7 +718,7 @@ bool GrammarMatcher::Impl::FillNextTokenBitmask(
 
   // Finally update the rejected_ids bitset
   bool can_reach_end = CanReachEnd();
-  SetTokenBitmask(
+  bool need_apply = SetTokenBitmask(
       bitmask_data_ptr,
       tmp_accepted_bitset_,
       tmp_rejected_indices_,
@@ -646,7 +728,7 @@ bool GrammarMatcher::Impl::FillNextTokenBitmask(
   if (debug_print) {
     XGRAMMAR_LOG(INFO) << "Filled bitmask: " << PrintBitmask(bitmask_data_ptr, tokenizer_info_);
   }
-  return !IsTokenBitmaskAllTrue(bitmask_data_ptr);
+  return need_apply;
 }
 
 std::string GrammarMatcher::Impl::FindJumpForwardString() {
@@ -750,7 +832,7 @@ void GrammarMatcher::Impl::Rollback(int num_tokens) {
   }
 }
 
-void GrammarMatcher::Impl::SetTokenBitmask(
+bool GrammarMatcher::Impl::SetTokenBitmask(
     int32_t* bitmask_data_ptr,
     const DynamicBitset& accepted_bitset,
     const std::vector<int32_t>& rejected_indices,
@@ -765,7 +847,7 @@ void GrammarMatcher::Impl::SetTokenBitmask(
   DynamicBitset next_token_bitset(
       tokenizer_info_.GetVocabSize(), reinterpret_cast<uint32_t*>(bitmask_data_ptr)
   );
-  const auto& sorted_decoded_vocab = tokenizer_info_.GetSortedDecodedVocab();
+  const auto& sorted_token_ids = tokenizer_info_.GetSortedTokenIds();
 
   if (rejected_indices.size() == 1 && rejected_indices[0] == -1) {
     // If rejected_indices is the universal set, the final accepted token set is just
@@ -784,27 +866,36 @@ void GrammarMatcher::Impl::SetTokenBitmask(
         next_token_bitset.Set(id, true);
       }
     }
-  } else {
-    // Otherwise, the final rejected token set is (rejected_indices \ accepted_indices)
-    next_token_bitset.Set();
+    return !next_token_bitset.All();
+  }
 
+  // Otherwise, the final rejected token set is (rejected_indices \ accepted_indices)
+  next_token_bitset.Set();
+  bool has_rejected = false;
+
+  if (!rejected_indices.empty()) {
+    // Clear the rejected tokens bit by bit, then restore the accepted ones word by word. This
+    // avoids a random lookup into accepted_bitset for every rejected token.
     for (auto i : rejected_indices) {
-      auto id = sorted_decoded_vocab[i].first;
-      if (!accepted_bitset[id]) {
-        next_token_bitset.Set(id, false);
-      }
+      next_token_bitset.Set(sorted_token_ids[i], false);
     }
-    if (!allow_special_token) {
-      for (int id : tokenizer_info_.GetSpecialTokenIds()) {
-        next_token_bitset.Set(id, false);
-      }
+    next_token_bitset |= accepted_bitset;
+    has_rejected = true;
+  }
+  if (!allow_special_token && !tokenizer_info_.GetSpecialTokenIds().empty()) {
+    for (int id : tokenizer_info_.GetSpecialTokenIds()) {
+      next_token_bitset.Set(id, false);
     }
-    if (!can_reach_end) {
-      for (int id : stop_token_ids_) {
-        next_token_bitset.Set(id, false);
-      }
+    has_rejected = true;
+  }
+  if (!can_reach_end && !stop_token_ids_.empty()) {
+    for (int id : stop_token_ids_) {
+      next_token_bitset.Set(id, false);
     }
+    has_rejected = true;
   }
+  // When nothing is cleared, the bitmask is known to be all-true without scanning it
+  return has_rejected && !next_token_bitset.All();
 }
 
 int GrammarMatcher::Impl::GetNextUncertainToken(
@@ -836,10 +927,15 @@ GrammarMatcher::GrammarMatcher(
     const CompiledGrammar& compiled_grammar,
     std::optional<std::vector<int>> override_stop_tokens,
     bool terminate_without_stop_token,
-    int max_rollback_tokens
+    int max_rollback_tokens,
+    int bitmask_cache_size
 )
     : pimpl_(std::make_shared<GrammarMatcher::Impl>(
-          compiled_grammar, override_stop_tokens, terminate_without_stop_token, max_rollback_tokens
+          compiled_grammar,
+          override_stop_tokens,
+          terminate_without_stop_token,
+          max_rollback_tokens,
+          bitmask_cache_size
       )) {}
 
 bool GrammarMatcher::AcceptToken(int32_t token_id, bool debug_print) {
@@ -148,7 +148,14 @@ NB_MODULE(xgrammar_bindings, m) {
       )
       .def(
           "compile_grammar",
-          &GrammarCompiler::CompileGrammar,
+          nb::overload_cast<const Grammar&>(&GrammarCompiler::CompileGrammar),
+          nb::call_guard<nb::gil_scoped_release>()
+      )
+      .def(
+          "compile_grammar",
+          nb::overload_cast<const std::string&, const std::string&>(
+              &GrammarCompiler::CompileGrammar
+          ),
           nb::call_guard<nb::gil_scoped_release>()
       )
       .def("clear_cache", &GrammarCompiler::ClearCache)
@@ -158,13 +165,15 @@ NB_MODULE(xgrammar_bindings, m) {
   auto pyGrammarMatcher = nb::class_<GrammarMatcher>(m, "GrammarMatcher");
   pyGrammarMatcher
       .def(
-          nb::init<const CompiledGrammar&, std::optional<std::vector<int>>, bool, int>(),
+          nb::init<const CompiledGrammar&, std::optional<std::vector<int>>, bool, int, int>(),
           nb::arg("compiled_grammar"),
           nb::arg("override_stop_tokens").none(),
           nb::arg("terminate_without_stop_token"),
-          nb::arg("max_rollback_tokens")
+          nb::arg("max_rollback_tokens"),
+          nb::arg("bitmask_cache_size")
       )
       .def("accept_token", &GrammarMatcher::AcceptToken, nb::call_guard<nb::gil_scoped_release>())
+      .def("accept_tokens", &GrammarMatcher_AcceptTokens, nb::call_guard<nb::gil_scoped_release>())
       .def("accept_string", &GrammarMatcher::AcceptString, nb::call_guard<nb::gil_scoped_release>())
       .def(
           "accept_string",
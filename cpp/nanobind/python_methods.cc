@@ -39,6 +39,19 @@ int TokenizerInfo_GetVocabType(const TokenizerInfo& tokenizer) {
   return static_cast<int>(tokenizer.GetVocabType());
 }
 
+int GrammarMatcher_AcceptTokens(
+    GrammarMatcher& matcher, const std::vector<int32_t>& token_ids, bool debug_print
+) {
+  int num_accepted = 0;
+  for (auto token_id : token_ids) {
+    if (!matcher.AcceptToken(token_id, debug_print)) {
+      break;
+    }
+    ++num_accepted;
+  }
+  return num_accepted;
+}
+
 bool GrammarMatcher_FillNextTokenBitmask(
     GrammarMatcher& matcher,
     intptr_t token_bitmask_ptr,
@@ -27,6 +27,10 @@ TokenizerInfo TokenizerInfo_Init(
 
 int TokenizerInfo_GetVocabType(const TokenizerInfo& tokenizer);
 
+int GrammarMatcher_AcceptTokens(
+    GrammarMatcher& matcher, const std::vector<int32_t>& token_ids, bool debug_print
+);
+
 bool GrammarMatcher_FillNextTokenBitmask(
     GrammarMatcher& matcher,
     intptr_t token_bitmask_ptr,
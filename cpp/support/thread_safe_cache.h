@@ -237,6 +237,13 @@ class LRUCacheImpl {
     } while (predicate() && iter != lru_list_.end());
   }
 
+  /*! \brief Removes the node from both the map and the LRU list. */
+  void LRUErase(typename std::unordered_map<Key, Entry>::iterator it) {
+    using ListIterator = typename List<std::pair<const Key, Entry>*>::iterator;
+    lru_list_.Erase(ListIterator(it->second.index, lru_list_));
+    map_.erase(it);
+  }
+
   std::unordered_map<Key, Entry>& GetMap() { return map_; }
 
  private:
@@ -293,7 +300,7 @@ class ThreadSafeLRUCache {
         [] { return true; },
         [&](const std::shared_future<SizedValue>& value) {
           // always evict and block until the value is ready
-          current_size_ -= value.get().size;
+          current_size_ -= GetSize(value);
           return true;
         }
     );
@@ -338,7 +345,7 @@ class ThreadSafeLRUCache {
           using namespace std::chrono_literals;
           // if not ready, then do not wait and block here
           if (value.wait_for(0s) != std::future_status::ready) return false;
-          current_size_ -= value.get().size;
+          current_size_ -= GetSize(value);
           return true;
         }
     );
@@ -346,6 +353,13 @@ class ThreadSafeLRUCache {
     // perform the costly computation outside all locks
     lock_map.unlock();
     task();
+
+    // do not keep failed computations, so that the next Get() retries the key
+    if (IsFailed(future)) {
+      lock_map.lock();
+      auto it = map.find(key);
+      if (it != map.end() && IsFailed(it->second.value)) cache_.LRUErase(it);
+    }
     return future;
   }
 
@@ -375,9 +389,37 @@ class ThreadSafeLRUCache {
     // perform the costly computation outside all locks
     lock_map.unlock();
     task();
+
+    // do not keep failed computations, so that the next Get() retries the key
+    if (IsFailed(future)) {
+      lock_map.lock();
+      auto it = map.find(key);
+      if (it != map.end() && IsFailed(it->second.value)) map.erase(it);
+    }
     return future;
   }
 
+  /*! \brief Returns true if the value is ready and its computation threw an exception. */
+  static bool IsFailed(const std::shared_future<SizedValue>& value) {
+    using namespace std::chrono_literals;
+    if (value.wait_for(0s) != std::future_status::ready) return false;
+    try {
+      value.get();
+      return false;
+    } catch (...) {
+      return true;
+    }
+  }
+
+  /*! \brief Returns the size of a computed value. Failed computations are never counted. */
+  static std::size_t GetSize(const std::shared_future<SizedValue>& value) {
+    try {
+      return value.get().size;
+    } catch (...) {
+      return 0;
+    }
+  }
+
  private:
   const std::size_t max_size_;
   const Computer computer_;
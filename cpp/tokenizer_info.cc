@@ -38,6 +38,7 @@ class TokenizerInfo::Impl {
   const std::vector<std::pair<int32_t, std::string>>& GetSortedDecodedVocab() const {
     return sorted_decoded_vocab_;
   }
+  const std::vector<int32_t>& GetSortedTokenIds() const { return sorted_token_ids_; }
 
   std::string DumpMetadata() const;
 
@@ -62,6 +63,9 @@ class TokenizerInfo::Impl {
   /*! \brief All (id, token) pairs sorted in lexicographic order. This sorting is done to
    * maximize prefix reuse during matching. Special tokens and stop tokens are not included. */
   std::vector<std::pair<int32_t, std::string>> sorted_decoded_vocab_;
+  /*! \brief The token ids of sorted_decoded_vocab_, stored contiguously so that mapping the
+   * indices of sorted_decoded_vocab_ to token ids does not touch the token strings. */
+  std::vector<int32_t> sorted_token_ids_;
   /*! \brief The stop tokens. When the GrammarMatcher can reach the end of the grammar,
    * stop tokens can be accepted. */
   std::vector<int32_t> stop_token_ids_;
@@ -363,6 +367,11 @@ TokenizerInfo::Impl::Impl(
     return a.second < b.second;
   };
   std::sort(sorted_decoded_vocab_.begin(), sorted_decoded_vocab_.end(), f_compare_token);
+
+  sorted_token_ids_.reserve(sorted_decoded_vocab_.size());
+  for (const auto& [id, token] : sorted_decoded_vocab_) {
+    sorted_token_ids_.push_back(id);
+  }
 }
 
 std::string TokenizerInfo::Impl::DumpMetadata() const {
@@ -458,6 +467,9 @@ const std::vector<int32_t>& TokenizerInfo::GetSpecialTokenIds() const {
 const std::vector<std::pair<int32_t, std::string>>& TokenizerInfo::GetSortedDecodedVocab() const {
   return pimpl_->GetSortedDecodedVocab();
 }
+const std::vector<int32_t>& TokenizerInfo::GetSortedTokenIds() const {
+  return pimpl_->GetSortedTokenIds();
+}
 
 std::string TokenizerInfo::DumpMetadata() const { return pimpl_->DumpMetadata(); }
 
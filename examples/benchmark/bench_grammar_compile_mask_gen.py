@@ -83,6 +83,15 @@ if __name__ == "__main__":
     )
     parser.add_argument("--num_iters", type=int, default=5)
     parser.add_argument("--num_warmup", type=int, default=-1)
+    parser.add_argument(
+        "--enable_cache",
+        action="store_true",
+        help="Reuse compiled grammars and guides of the same schema across iterations, so the "
+        "build time measures the steady state instead of the cold compilation",
+    )
+    parser.add_argument(
+        "--debug", action="store_true", help="Print the prompt and schema of each data point"
+    )
     args = parser.parse_args()
 
     backend = args.backend
@@ -95,12 +104,36 @@ if __name__ == "__main__":
 
     hf_tokenizer = AutoTokenizer.from_pretrained(hf_model_path)
     xgrammar_tokenizer_info = xgr.TokenizerInfo.from_huggingface(hf_tokenizer)
-    xgrammar_grammar_compiler = xgr.GrammarCompiler(xgrammar_tokenizer_info)
+    xgrammar_grammar_compiler = xgr.GrammarCompiler(
+        xgrammar_tokenizer_info, cache_enabled=args.enable_cache
+    )
     outlines_tokenizer = TransformerTokenizer(hf_tokenizer)
     lmformatenforcer_tokenizer = build_token_enforcer_tokenizer_data(hf_tokenizer)
 
     vocab_size = len(hf_tokenizer)
 
+    # The dataset and the tokenizer are fixed, so the tokenization is done once before timing
+    schemas = dataset["schema"]
+    prompts = [
+        hf_tokenizer.apply_chat_template(prompt, tokenize=False) for prompt in dataset["prompt"]
+    ]
+    all_prompt_token_ids = [hf_tokenizer.encode(prompt) for prompt in prompts]
+    all_token_ids = [
+        hf_tokenizer.encode(completion, add_special_tokens=False)
+        for completion in dataset["completion"]
+    ]
+
+    # The logits buffer is allocated once and refilled in place for each data point
+    max_num_tokens = max(len(token_ids) for token_ids in all_token_ids)
+    logits_buffer = torch.empty((max_num_tokens, vocab_size), dtype=torch.float32, device="cuda")
+
+    # The bitmask shape only depends on the tokenizer, so it is allocated once. It lives on the
+    # same device as the logits, as required by apply_token_bitmask_inplace
+    bitmask = xgr.allocate_token_bitmask(1, xgrammar_tokenizer_info.vocab_size).to("cuda")
+
+    # Outlines guides keyed by schema, used when --enable_cache is set
+    outlines_guide_cache = {}
+
     build_time = 0
     exec_time = 0
     total_data_points = 0
@@ -127,22 +160,24 @@ if __name__ == "__main__":
             if data_point_idx in wrong_data_indices:
                 continue
 
-            schema = dataset["schema"][data_point_idx]
-            completion = dataset["completion"][data_point_idx]
-            token_ids = hf_tokenizer.encode(completion, add_special_tokens=False)
-            prompt = hf_tokenizer.apply_chat_template(
-                dataset["prompt"][data_point_idx], tokenize=False
-            )
-            prompt_token_ids = hf_tokenizer.encode(prompt)
-            print(f"Prompt: {prompt}, Schema: {schema}")
+            schema = schemas[data_point_idx]
+            token_ids = all_token_ids[data_point_idx]
+            prompt_token_ids = all_prompt_token_ids[data_point_idx]
+            if args.debug:
+                print(f"Prompt: {prompts[data_point_idx]}, Schema: {schema}")
 
             start = time.perf_counter()
             try:
                 if backend == "xgrammar":
                     worker = xgrammar_build(schema, xgrammar_grammar_compiler)
-                    bitmask = xgr.allocate_token_bitmask(worker.vocab_size)
+                    xgr.reset_token_bitmask(bitmask)
                 elif backend == "outlines":
-                    worker = outlines_build(schema, outlines_tokenizer)
+                    if args.enable_cache and schema in outlines_guide_cache:
+                        worker = outlines_guide_cache[schema]
+                    else:
+                        worker = outlines_build(schema, outlines_tokenizer)
+                        if args.enable_cache:
+                            outlines_guide_cache[schema] = worker
                 elif backend == "lmformatenforcer":
                     worker = lmformatenforcer_build(schema, lmformatenforcer_tokenizer)
             except Exception as e:
@@ -154,7 +189,8 @@ if __name__ == "__main__":
 
             # use different logits for each mask generation process
             # to avoid caching effects between different tokens
-            logits = [torch.randn(vocab_size).cuda() for _ in range(len(token_ids))]
+            logits = logits_buffer[: len(token_ids)]
+            logits.normal_()
 
             torch.cuda.synchronize()
             start = time.perf_counter()
@@ -190,5 +226,8 @@ if __name__ == "__main__":
 
     print(f"Backend: {backend}")
     print(f"Fail count: {fail_cnt / num_iters:.0f} / {len(dataset) - len(wrong_data_indices)}")
+    if total_data_points == 0:
+        print("No data point succeeded, so no timing is reported")
+        exit(1)
     print(f"Grammar preprocessing time (ms): {build_time / total_data_points * 1e3:.4f}")
     print(f"Mask generation time (us/token): {exec_time / total_tokens * 1e6:.4f}")
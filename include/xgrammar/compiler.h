@@ -70,6 +70,14 @@ class GrammarCompiler {
   /*! \brief Get the compiled grammar for a grammar. */
   CompiledGrammar CompileGrammar(const Grammar& grammar);
 
+  /*!
+   * \brief Get the compiled grammar for an EBNF string. The cache is looked up with the EBNF
+   * string directly, so the string is only parsed when the grammar is not cached.
+   */
+  CompiledGrammar CompileGrammar(
+      const std::string& ebnf_str, const std::string& root_rule_name = "root"
+  );
+
   /*! \brief Get the compiled grammar for a structural tag. */
   CompiledGrammar CompileStructuralTag(
       const std::vector<StructuralTagItem>& tags, const std::vector<std::string>& triggers
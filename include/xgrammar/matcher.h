@@ -70,12 +70,15 @@ class GrammarMatcher {
    * CompiledGrammar.
    * \param compiled_grammar The compiled grammar. It is obtained through
    * CreateCompiledGrammar as a result of preprocessing the grammar and tokenizer.
+   * \param bitmask_cache_size The maximum number of filled bitmasks cached by FillNextTokenBitmask,
+   * keyed by the matching state. Each entry takes about vocab_size / 8 bytes. 0 disables the cache.
    */
   GrammarMatcher(
       const CompiledGrammar& compiled_grammar,
       std::optional<std::vector<int>> override_stop_tokens = std::nullopt,
       bool terminate_without_stop_token = false,
-      int max_rollback_tokens = 0
+      int max_rollback_tokens = 0,
+      int bitmask_cache_size = 0
   );
 
   /*!
@@ -39,6 +39,8 @@ class TokenizerInfo {
   const std::vector<int32_t>& GetStopTokenIds() const;
   const std::vector<int32_t>& GetSpecialTokenIds() const;
   const std::vector<std::pair<int32_t, std::string>>& GetSortedDecodedVocab() const;
+  /*! \brief The token ids of GetSortedDecodedVocab(), in the same order. */
+  const std::vector<int32_t>& GetSortedTokenIds() const;
   std::string DumpMetadata() const;
 
   static TokenizerInfo FromVocabAndMetadata(
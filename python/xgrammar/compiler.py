@@ -208,7 +208,9 @@ class GrammarCompiler(XGRObject):
         self, grammar: Union[str, Grammar], *, root_rule_name: str = "root"
     ) -> CompiledGrammar:
         if isinstance(grammar, str):
-            grammar = Grammar.from_ebnf(grammar, root_rule_name=root_rule_name)
+            return CompiledGrammar._create_from_handle(
+                self._handle.compile_grammar(grammar, root_rule_name)
+            )
         return CompiledGrammar._create_from_handle(self._handle.compile_grammar(grammar._handle))
 
     def clear_cache(self) -> None:
@@ -1,5 +1,6 @@
 """This module provides classes representing grammars."""
 
+import functools
 import json
 from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
@@ -7,6 +8,25 @@ from pydantic import BaseModel, Field
 
 from .base import XGRObject, _core
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string. orjson is used when it is installed, since it is much
+    faster than the json module on large schemas. Its output is compact and keeps non-ASCII
+    characters as UTF-8, so it differs textually from json.dumps but parses to the same object.
+    Objects that orjson cannot serialize, e.g. integers beyond 64 bits, fall back to the json
+    module."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj)
+
 
 class StructuralTagItem(BaseModel):
     """A structural tag item. See Grammar.from_structural_tag() for more details."""
@@ -19,6 +39,19 @@ class StructuralTagItem(BaseModel):
     """The end tag."""
 
 
+@functools.lru_cache(maxsize=128)
+def _convert_pydantic_model_to_str(schema: Type[BaseModel]) -> str:
+    """Convert a Pydantic model class to a JSON schema string. Generating the JSON schema of a
+    model is expensive, and the same model class is usually converted many times (e.g. once per
+    request), so the result is cached per class."""
+    if hasattr(schema, "model_json_schema"):
+        return _json_dumps(schema.model_json_schema())
+    if hasattr(schema, "schema_json"):
+        return json.dumps(schema.schema_json())
+    else:
+        raise ValueError("The schema should have a model_json_schema or json_schema method.")
+
+
 def _convert_schema_to_str(schema: Union[str, Type[BaseModel], Dict[str, Any]]) -> str:
     """Convert a schema to a string representation.
 
@@ -44,16 +77,11 @@ def _convert_schema_to_str(schema: Union[str, Type[BaseModel], Dict[str, Any]])
         If the schema type is not supported, or the dictionary is not serializable.
     """
     if isinstance(schema, type) and issubclass(schema, BaseModel):
-        if hasattr(schema, "model_json_schema"):
-            return json.dumps(schema.model_json_schema())
-        if hasattr(schema, "schema_json"):
-            return json.dumps(schema.schema_json())
-        else:
-            raise ValueError("The schema should have a model_json_schema or json_schema method.")
+        return _convert_pydantic_model_to_str(schema)
     elif isinstance(schema, str):
         return schema
     elif isinstance(schema, dict):
-        return json.dumps(schema)
+        return _json_dumps(schema)
     else:
         raise ValueError("The schema should be a string or a Pydantic model.")
 
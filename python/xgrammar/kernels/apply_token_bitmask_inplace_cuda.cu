@@ -275,8 +275,11 @@ void ApplyTokenBitmaskInplace(
 }
 
 TORCH_LIBRARY_FRAGMENT(TORCH_EXTENSION_NAME, m) {
+  // logits is annotated as mutated in place, so torch.compile and CUDA graph capture keep the op
+  // in the graph and order it correctly with the surrounding reads of logits
   m.def(
-      "apply_token_bitmask_inplace_cuda(Tensor logits, Tensor bitmask, Tensor? indices=None) -> ()"
+      "apply_token_bitmask_inplace_cuda(Tensor(a!) logits, Tensor bitmask, Tensor? indices=None) "
+      "-> ()"
   );
 }
 
@@ -1,39 +1,50 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import torch
 
+# The bit positions 0..31 of an int32 word, cached per device to avoid recreating them in every
+# call.
+_BIT_INDICES_CACHE: Dict[torch.device, torch.Tensor] = {}
+
+
+def _get_bit_indices(device: torch.device) -> torch.Tensor:
+    bit_indices = _BIT_INDICES_CACHE.get(device)
+    if bit_indices is None:
+        bit_indices = torch.arange(32, device=device, dtype=torch.int32)
+        _BIT_INDICES_CACHE[device] = bit_indices
+    return bit_indices
+
 
 @torch.compile(dynamic=True)
 def apply_token_bitmask_inplace_kernel_no_indices_torch_compile(
-    logits: torch.Tensor, bitmask: torch.Tensor, vocab_size: int
+    logits: torch.Tensor, bitmask: torch.Tensor, bit_indices: torch.Tensor, vocab_size: int
 ) -> None:
     # logits: (batch_size, vocab_size)
     # bitmask: (batch_size, bitmask_size)
-    # mask_expanded: (batch_size, 32 * bitmask_size)
-    mask_expanded = torch.repeat_interleave(bitmask, 32, dim=-1)
-    # bit_indices: (32 * bitmask_size,)
-    bit_indices = torch.arange(32, device=logits.device, dtype=torch.int32).repeat(
-        bitmask.shape[-1]
-    )
+    # bit_indices: (32,)
+    # Unpack each int32 word into its 32 bits by broadcasting against bit_indices, so the compiled
+    # kernel reads one word per 32 tokens instead of materializing a 32x expanded copy.
     # bit_masks: (batch_size, 32 * bitmask_size)
-    bit_masks = (mask_expanded >> bit_indices) & 1
+    bit_masks = ((bitmask.unsqueeze(-1) >> bit_indices) & 1).flatten(-2)
     bit_masks = bit_masks[..., :vocab_size]
-    logits[..., :vocab_size] = logits[..., :vocab_size].masked_fill_(bit_masks == 0, float("-inf"))
+    # logits[..., :vocab_size] is a view, so the masked fill writes to logits directly without a
+    # write-back copy.
+    logits[..., :vocab_size].masked_fill_(bit_masks == 0, float("-inf"))
 
 
 @torch.compile(dynamic=True)
 def apply_token_bitmask_inplace_kernel_indices_torch_compile(
-    logits: torch.Tensor, bitmask: torch.Tensor, vocab_size: int, indices: List[int]
+    logits: torch.Tensor,
+    bitmask: torch.Tensor,
+    bit_indices: torch.Tensor,
+    vocab_size: int,
+    indices: List[int],
 ) -> None:
     # logits: (batch_size, vocab_size)
     # bitmask: (batch_size, bitmask_size)
-    # mask_expanded: (batch_size, 32 * bitmask_size)
-    mask_expanded = torch.repeat_interleave(bitmask[indices], 32, dim=-1)
-    # bit_indices: (32 * bitmask_size,)
-    bit_indices = torch.arange(32, device=logits.device, dtype=torch.int32).repeat(
-        bitmask.shape[-1]
-    )
-    bit_masks = (mask_expanded >> bit_indices) & 1
+    # bit_indices: (32,)
+    # bit_masks: (len(indices), 32 * bitmask_size)
+    bit_masks = ((bitmask[indices].unsqueeze(-1) >> bit_indices) & 1).flatten(-2)
     bit_masks = bit_masks[..., :vocab_size]
     logits[indices, :vocab_size] = logits[indices, :vocab_size].masked_fill_(
         bit_masks == 0, float("-inf")
@@ -47,9 +58,12 @@ def apply_token_bitmask_inplace_torch_compile(
     indices: Optional[List[int]] = None,
 ) -> None:
     vocab_size = min(logits.shape[-1], bitmask.shape[-1] * 32) if vocab_size is None else vocab_size
+    bit_indices = _get_bit_indices(logits.device)
     if indices is None:
-        apply_token_bitmask_inplace_kernel_no_indices_torch_compile(logits, bitmask, vocab_size)
+        apply_token_bitmask_inplace_kernel_no_indices_torch_compile(
+            logits, bitmask, bit_indices, vocab_size
+        )
     else:
         apply_token_bitmask_inplace_kernel_indices_torch_compile(
-            logits, bitmask, vocab_size, indices
+            logits, bitmask, bit_indices, vocab_size, indices
         )
@@ -182,6 +182,12 @@ class GrammarMatcher(XGRObject):
     max_rollback_tokens : int, default: 0
         The maximum number of rollback tokens allowed. The rollback operation is useful for
         jump-forward decoding and speculative decoding.
+
+    bitmask_cache_size : int, default: 0
+        The maximum number of bitmasks cached by fill_next_token_bitmask, keyed by the matching
+        state. Revisiting a cached state, e.g. inside a long JSON string, then only copies the
+        bitmask. Each entry takes about vocab_size / 8 bytes, e.g. 16 KB for a vocabulary of 128k
+        tokens. 0 disables the cache.
     """
 
     def __init__(
@@ -191,6 +197,7 @@ class GrammarMatcher(XGRObject):
         override_stop_tokens: Optional[Union[int, List[int]]] = None,
         terminate_without_stop_token: bool = False,
         max_rollback_tokens: int = 0,
+        bitmask_cache_size: int = 0,
     ) -> None:
         if not isinstance(compiled_grammar, CompiledGrammar):
             raise ValueError("The grammar should be compiled before passing it to GrammarMatcher.")
@@ -204,8 +211,28 @@ class GrammarMatcher(XGRObject):
                 override_stop_tokens,
                 terminate_without_stop_token,
                 max_rollback_tokens,
+                bitmask_cache_size,
             )
         )
+        self._vocab_size: int = compiled_grammar.tokenizer_info.vocab_size
+
+        # The CPU bitmask passed in the last fill_next_token_bitmask call, with its data pointer
+        # and shape. In decoding loops the same bitmask is filled repeatedly, so its checks are
+        # skipped and its shape list is reused as long as the tensor and its storage stay the same.
+        self._cached_bitmask: Optional[torch.Tensor] = None
+        self._cached_bitmask_ptr: int = 0
+        self._cached_bitmask_shape: List[int] = []
+
+        # Pinned host buffer used to fill bitmasks on CUDA devices. Allocated on first use.
+        self._staging_bitmask: Optional[torch.Tensor] = None
+        self._staging_copy_event: Optional["torch.cuda.Event"] = None
+
+        # The bitmask used by mask_logits_inplace. Allocated on the device of the logits.
+        self._logits_bitmask: Optional[torch.Tensor] = None
+
+        # The pinned host bitmask returned by fill_next_token_bitmask_pinned. Allocated on first
+        # use.
+        self._pinned_bitmask: Optional[torch.Tensor] = None
 
     def accept_token(self, token_id: int, *, debug_print: bool = False) -> bool:
         """Accept one token and update the state of the matcher.
@@ -242,6 +269,36 @@ class GrammarMatcher(XGRObject):
         """
         return self._handle.accept_token(token_id, debug_print)
 
+    def accept_tokens(self, token_ids: List[int], *, debug_print: bool = False) -> int:
+        """Accept a sequence of tokens and update the state of the matcher. The tokens are
+        accepted one by one in C++ until a token is not accepted, so it is faster than calling
+        accept_token in a loop. Every accepted token is considered as one step in rollback.
+
+        Tokens are rejected in the same cases as in accept_token. After a token is rejected, the
+        following tokens are not examined, and the tokens before it remain accepted.
+
+        Parameters
+        ----------
+        token_ids : List[int]
+            The ids of the tokens to accept.
+
+        debug_print : bool, default: False
+            Whether to print information about the internal state of the matcher. Helpful
+            for debugging.
+
+        Returns
+        -------
+        num_accepted : int
+            The number of accepted tokens, i.e. the index of the first rejected token, or
+            len(token_ids) if all tokens are accepted.
+
+        Raises
+        ------
+        RuntimeError
+            If the recursion depth is exceeded.
+        """
+        return self._handle.accept_tokens(token_ids, debug_print)
+
     def accept_string(self, input_str: Union[str, bytes], *, debug_print: bool = False) -> bool:
         """Accept a string and update the state of the matcher. The whole string is considered
         as one step in rollback. It is used to complement the functionality of accept_token, and
@@ -272,8 +329,13 @@ class GrammarMatcher(XGRObject):
         self, bitmask: torch.Tensor, index: int = 0, *, debug_print: bool = False
     ) -> bool:
         """Fill the bitmask for the next token prediction. The input bitmask can be generated
-        by allocate_token_bitmask, and must be on CPU. bitmask[index] will be filled with the
-        next token bitmask.
+        by allocate_token_bitmask, and should be on CPU or on a CUDA device. bitmask[index] will be
+        filled with the next token bitmask.
+
+        If the bitmask is on a CUDA device, the mask is first generated into a pinned host buffer
+        owned by the matcher, and then copied to bitmask[index] asynchronously on the current CUDA
+        stream. Kernels later launched on the same stream, such as apply_token_bitmask_inplace,
+        will see the filled bitmask without an explicit synchronization.
 
         This method does not change the matcher state.
 
@@ -299,13 +361,159 @@ class GrammarMatcher(XGRObject):
         RuntimeError
             If the recursion depth is exceeded.
         """
-        if bitmask.device.type != "cpu":
-            raise ValueError("bitmask should be on CPU.")
+        data_ptr = bitmask.data_ptr()
+        # Fast path: the same CPU bitmask as the last call has already been checked
+        if bitmask is self._cached_bitmask and data_ptr == self._cached_bitmask_ptr:
+            return self._handle.fill_next_token_bitmask(
+                data_ptr, self._cached_bitmask_shape, index, debug_print
+            )
+
         if bitmask.dtype != bitmask_dtype:
             raise ValueError(f"bitmask should be of type {bitmask_dtype}.")
+        if bitmask.device.type == "cuda":
+            return self._fill_next_token_bitmask_cuda(bitmask, index, debug_print)
+        if bitmask.device.type != "cpu":
+            raise ValueError("bitmask should be on CPU or CUDA.")
+        self._cached_bitmask = bitmask
+        self._cached_bitmask_ptr = data_ptr
+        self._cached_bitmask_shape = list(bitmask.shape)
         return self._handle.fill_next_token_bitmask(
-            bitmask.data_ptr(), list(bitmask.shape), index, debug_print
+            data_ptr, self._cached_bitmask_shape, index, debug_print
+        )
+
+    def _fill_next_token_bitmask_cuda(
+        self, bitmask: torch.Tensor, index: int, debug_print: bool
+    ) -> bool:
+        """Fill bitmask[index] on a CUDA device through the pinned host staging buffer."""
+        if bitmask.dim() == 1:
+            if index != 0:
+                raise ValueError("The index should be 0 when the bitmask is 1D.")
+            target = bitmask
+        elif bitmask.dim() == 2:
+            target = bitmask[index]
+        else:
+            raise ValueError(f"bitmask should be 1D or 2D, but got {bitmask.dim()}D.")
+
+        bitmask_size = bitmask.shape[-1]
+        if self._staging_bitmask is None or self._staging_bitmask.shape[0] != bitmask_size:
+            self._staging_bitmask = torch.empty(
+                (bitmask_size,), dtype=bitmask_dtype, pin_memory=True
+            )
+            self._staging_copy_event = torch.cuda.Event()
+        else:
+            # The copy issued by the previous call may still be reading the staging buffer
+            self._staging_copy_event.synchronize()
+
+        need_apply = self._handle.fill_next_token_bitmask(
+            self._staging_bitmask.data_ptr(), [bitmask_size], 0, debug_print
+        )
+        stream = torch.cuda.current_stream(bitmask.device)
+        with torch.cuda.stream(stream):
+            target.copy_(self._staging_bitmask, non_blocking=True)
+        self._staging_copy_event.record(stream)
+        return need_apply
+
+    def fill_next_token_bitmask_pinned(
+        self, *, debug_print: bool = False
+    ) -> Tuple[torch.Tensor, bool]:
+        """Fill the bitmask for the next token prediction into a pinned host buffer owned by the
+        matcher, and return the buffer. The buffer has shape (ceil(vocab_size / 32),) and can be
+        copied to a CUDA device with copy_(non_blocking=True), so that the transfer overlaps with
+        other work on the device.
+
+        The same buffer is reused and overwritten by the next call. If it is copied
+        asynchronously, the copy should finish (e.g. by synchronizing the stream or an event)
+        before this method is called again.
+
+        This method does not change the matcher state. Pinned memory requires CUDA, so it is not
+        available with a CPU-only torch build; use fill_next_token_bitmask there instead.
+
+        Parameters
+        ----------
+        debug_print : bool, default: False
+            Whether to print information about generated bitmask. Helpful for debugging.
+
+        Returns
+        -------
+        bitmask : torch.Tensor
+            The pinned host buffer filled with the next token bitmask.
+
+        need_apply : bool
+            Whether the bitmask need to be applied (not all-true).
+
+        Raises
+        ------
+        ValueError
+            If CUDA is not available.
+
+        RuntimeError
+            If the recursion depth is exceeded.
+        """
+        bitmask = self._pinned_bitmask
+        if bitmask is None:
+            if not torch.cuda.is_available():
+                raise ValueError(
+                    "fill_next_token_bitmask_pinned requires CUDA to allocate pinned memory. Use "
+                    "fill_next_token_bitmask instead."
+                )
+            bitmask = torch.empty(
+                get_bitmask_shape(1, self._vocab_size)[1:], dtype=bitmask_dtype, pin_memory=True
+            )
+            self._pinned_bitmask = bitmask
+        need_apply = self._handle.fill_next_token_bitmask(
+            bitmask.data_ptr(), list(bitmask.shape), 0, debug_print
         )
+        return bitmask, need_apply
+
+    def mask_logits_inplace(self, logits: torch.Tensor, *, debug_print: bool = False) -> bool:
+        """Generate the mask for the next token and apply it to the logits in-place. This is
+        equivalent to calling fill_next_token_bitmask and apply_token_bitmask_inplace, but the
+        bitmask is managed by the matcher, and the masking is skipped when no token is masked.
+
+        The logits should be of a single sequence, with shape (vocab_size,) or (1, vocab_size).
+        Padding on the vocabulary dimension is allowed. The logits can be on CPU or on a CUDA
+        device.
+
+        This method does not change the matcher state.
+
+        Parameters
+        ----------
+        logits : torch.Tensor
+            The logits to apply the mask to.
+
+        debug_print : bool, default: False
+            Whether to print information about generated bitmask. Helpful for debugging.
+
+        Returns
+        -------
+        need_apply : bool
+            Whether any token is masked. If False, the logits are left unchanged.
+
+        Raises
+        ------
+        ValueError
+            If the logits are not of a single sequence.
+
+        RuntimeError
+            If the recursion depth is exceeded.
+        """
+        if not (logits.dim() == 1 or (logits.dim() == 2 and logits.shape[0] == 1)):
+            raise ValueError(
+                f"The logits should have shape (vocab_size,) or (1, vocab_size), but got "
+                f"{tuple(logits.shape)}"
+            )
+        bitmask = self._logits_bitmask
+        if bitmask is None or bitmask.device != logits.device:
+            bitmask = torch.empty(
+                get_bitmask_shape(1, self._vocab_size)[1:],
+                dtype=bitmask_dtype,
+                device=logits.device,
+            )
+            self._logits_bitmask = bitmask
+        need_apply = self.fill_next_token_bitmask(bitmask, debug_print=debug_print)
+        if need_apply:
+            apply_token_bitmask_inplace(logits, bitmask, vocab_size=self._vocab_size)
+        return need_apply
 
     def find_jump_forward_string(self) -> str:
         """Find the jump-forward string for jump-forward decoding. This is the longest string that
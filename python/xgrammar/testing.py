@@ -233,18 +233,16 @@ def _bool_mask_to_bitmask(bool_mask: torch.Tensor) -> torch.Tensor:
     bitmask : torch.Tensor
         The rejected token bitmask.
     """
-    bool_mask_int32 = bool_mask.to(torch.int32)
-    # Pad to multiple of 32
+    # Pad to multiple of 32. Pad the bool mask before widening it, so only one int32 temporary
+    # is created
     pad_size = (32 - bool_mask.shape[1] % 32) % 32
     if pad_size > 0:
-        bool_mask_int32 = torch.nn.functional.pad(bool_mask_int32, (0, pad_size), value=1)
-    bool_mask_view = bool_mask_int32.view(bool_mask.shape[0], -1, 32)
-    # To avoid error for overflow, we construct int64 weights and convert to int32
-    weights = torch.tensor(
-        [1 << i for i in range(32)], device=bool_mask.device, dtype=torch.int64
-    ).to(torch.int32)
-    bitmask = (bool_mask_view * weights).sum(dim=2)
-    return bitmask.to(torch.int32)
+        bool_mask = torch.nn.functional.pad(bool_mask, (0, pad_size), value=True)
+    bool_mask_view = bool_mask.view(bool_mask.shape[0], -1, 32)
+    # Shift each bit to its position and pack the 32 disjoint bits of a word by summation. The
+    # sum is accumulated in int32 directly, where 1 << 31 wraps to the sign bit as expected
+    bit_indices = torch.arange(32, device=bool_mask.device, dtype=torch.int32)
+    return (bool_mask_view.to(torch.int32) << bit_indices).sum(dim=2, dtype=torch.int32)
 
 
 def _get_matcher_from_grammar_and_tokenizer_info(
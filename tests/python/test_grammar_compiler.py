@@ -1,5 +1,6 @@
 """This test uses the optimized JSON grammar provided by the grammar library."""
 
+import json
 import sys
 import threading
 import time
@@ -10,6 +11,7 @@ from pydantic import BaseModel
 from transformers import AutoTokenizer
 
 import xgrammar as xgr
+from xgrammar.grammar import _convert_pydantic_model_to_str, _json_dumps
 from xgrammar.testing import _get_allow_empty_rule_ids
 
 
@@ -329,5 +331,68 @@ def test_grammar_compiler_cache_limited():
     assert grammar_compiler.get_cache_size_bytes() == 0
 
 
+def test_grammar_compiler_cache_ebnf_string():
+    tokenizer_info = xgr.TokenizerInfo(["a", "b", "ab", "c"])
+    grammar_compiler = xgr.GrammarCompiler(tokenizer_info, cache_limit_bytes=1)
+    ebnf_string = """root ::= "a" rule_a
+rule_a ::= "b" | "c"
+"""
+
+    compiled_grammar = grammar_compiler.compile_grammar(ebnf_string)
+    expected = xgr.Grammar.from_ebnf(ebnf_string)
+    assert str(compiled_grammar.grammar) == str(expected)
+
+    old_size = grammar_compiler.get_cache_size_bytes()
+    assert old_size > 0
+    compiled_grammar = grammar_compiler.compile_grammar(ebnf_string)
+    assert str(compiled_grammar.grammar) == str(expected)
+    assert grammar_compiler.get_cache_size_bytes() == old_size
+
+    with pytest.raises(RuntimeError):
+        grammar_compiler.compile_grammar("root ::= rule_a")
+
+    # The failed compilation is not cached: eviction and clear_cache() keep working
+    for i in range(4):
+        grammar_compiler.compile_grammar(f'root ::= "{"ab" * (i + 1)}"')
+    grammar_compiler.clear_cache()
+    assert grammar_compiler.get_cache_size_bytes() == 0
+    compiled_grammar = grammar_compiler.compile_grammar('root ::= "c"')
+    assert str(compiled_grammar.grammar) == str(xgr.Grammar.from_ebnf('root ::= "c"'))
+    with pytest.raises(RuntimeError):
+        grammar_compiler.compile_grammar("root ::= rule_a")
+
+
+def test_grammar_compiler_json_schema_pydantic_model_cache():
+    class Model(BaseModel):
+        name: str
+        num: int
+
+    tokenizer_info = xgr.TokenizerInfo(["a", "b", "ab", "c"])
+    grammar_compiler = xgr.GrammarCompiler(tokenizer_info)
+
+    hits = _convert_pydantic_model_to_str.cache_info().hits
+    compiled_grammar = grammar_compiler.compile_json_schema(Model)
+    compiled_grammar_from_str = grammar_compiler.compile_json_schema(
+        json.dumps(Model.model_json_schema())
+    )
+    assert str(compiled_grammar.grammar) == str(compiled_grammar_from_str.grammar)
+
+    # The schema string of the model is generated once and then reused
+    grammar_compiler.compile_json_schema(Model)
+    assert _convert_pydantic_model_to_str.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "object", "properties": {"name": {"type": "string", "description": "café"}}},
+        {"type": ["string", "null"], "default": None},
+        {"type": "integer", "maximum": 10**20},
+    ],
+)
+def test_json_dumps(schema: Dict):
+    assert json.loads(_json_dumps(schema)) == schema
+
+
 if __name__ == "__main__":
     pytest.main(sys.argv)
@@ -1,7 +1,7 @@
 """Test the basic functionality of GrammarMatcher."""
 
 import sys
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import pytest
 import torch
@@ -336,6 +336,151 @@ def test_vocab_size():
     assert rejected_tokens == [i for i in range(64) if i != 7]
 
 
+def test_accept_tokens():
+    vocab = [
+        # fmt: off
+        "<s>", "</s>", "a", "abc", 'b"', '"', ':"', "{", "}", ", ", "6", ":", "\n", " ", '"a":true',
+        # fmt: on
+    ]
+    tokenizer_info = xgr.TokenizerInfo(vocab, vocab_size=64)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info(
+        json_grammar, tokenizer_info, max_rollback_tokens=5
+    )
+
+    assert matcher.accept_tokens([7, 5, 2, 5]) == 4
+    # "}" is rejected after the key, so the following tokens are not examined
+    assert matcher.accept_tokens([11, 8, 10, 8]) == 1
+    matcher.rollback(2)
+    assert matcher.accept_tokens([5, 11, 10, 8, 1]) == 5
+    assert matcher.is_terminated()
+    assert matcher.accept_tokens([]) == 0
+
+
+@pytest.mark.parametrize("bitmask_cache_size", (0, 1, 32))
+def test_fill_next_token_bitmask_repeated_state(bitmask_cache_size: int):
+    vocab = [
+        # fmt: off
+        "<s>", "</s>", "a", "abc", 'b"', '"', ':"', "{", "}", ", ", "6", ":", "\n", " ", '"a":true',
+        # fmt: on
+    ]
+    input_splitted = ["{", '"', "a", "a", "a", "abc", "a", 'b"', ":", '"', "a", "a", '"', "}"]
+    input_ids = [vocab.index(t) for t in input_splitted]
+    tokenizer_info = xgr.TokenizerInfo(vocab)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info(
+        json_grammar,
+        tokenizer_info,
+        max_rollback_tokens=len(input_ids),
+        bitmask_cache_size=bitmask_cache_size,
+    )
+    token_bitmask = xgr.allocate_token_bitmask(1, tokenizer_info.vocab_size)
+    expected_bitmask = xgr.allocate_token_bitmask(1, tokenizer_info.vocab_size)
+
+    # The matcher revisits the same states inside the string and after rollback; the bitmask must
+    # match the one filled by a fresh matcher
+    for _ in range(2):
+        for i, token_id in enumerate(input_ids):
+            expected_matcher = _get_matcher_from_grammar_and_tokenizer_info(
+                json_grammar, tokenizer_info
+            )
+            assert expected_matcher.accept_tokens(input_ids[:i]) == i
+            expected_need_apply = expected_matcher.fill_next_token_bitmask(expected_bitmask)
+            assert matcher.fill_next_token_bitmask(token_bitmask) == expected_need_apply
+            torch.testing.assert_close(token_bitmask, expected_bitmask)
+            assert matcher.accept_token(token_id)
+        matcher.rollback(len(input_ids))
+
+
+@pytest.mark.parametrize("device", ("cpu", "cuda"))
+def test_mask_logits_inplace(device: str):
+    if device == "cuda" and not torch.cuda.is_available():
+        pytest.skip(reason="CUDA is not installed")
+
+    vocab = [
+        # fmt: off
+        "<s>", "</s>", "a", "abc", 'b"', '"', ':"', "{", "}", ", ", "6", ":", "\n", " ", '"a":true',
+        # fmt: on
+    ]
+    tokenizer_info = xgr.TokenizerInfo(vocab, vocab_size=64)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info(json_grammar, tokenizer_info)
+
+    token_bitmask = xgr.allocate_token_bitmask(1, tokenizer_info.vocab_size)
+    for token_id in [7, 5, 2, 5, 11, 10, 8]:
+        logits = torch.randn(tokenizer_info.vocab_size, dtype=torch.float32)
+        logits_expected = logits.clone()
+        need_apply_expected = matcher.fill_next_token_bitmask(token_bitmask)
+        if need_apply_expected:
+            xgr.apply_token_bitmask_inplace(logits_expected, token_bitmask[0])
+
+        logits = logits.to(device)
+        assert matcher.mask_logits_inplace(logits) == need_apply_expected
+        torch.testing.assert_close(logits.cpu(), logits_expected)
+        assert matcher.accept_token(token_id)
+
+
+@pytest.mark.parametrize("shape", ((2, 64), (1, 1, 64)))
+def test_mask_logits_inplace_invalid_shape(shape: Tuple[int, ...]):
+    tokenizer_info = xgr.TokenizerInfo(["a", "b"], vocab_size=64)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info('root ::= "a"', tokenizer_info)
+    logits = torch.zeros(shape, dtype=torch.float32)
+    with pytest.raises(ValueError):
+        matcher.mask_logits_inplace(logits)
+    assert torch.all(logits == 0)
+
+
+def test_fill_next_token_bitmask_cuda():
+    if not torch.cuda.is_available():
+        pytest.skip(reason="CUDA is not installed")
+
+    vocab = [
+        # fmt: off
+        "<s>", "</s>", "a", "abc", 'b"', '"', ':"', "{", "}", ", ", "6", ":", "\n", " ", '"a":true',
+        # fmt: on
+    ]
+    tokenizer_info = xgr.TokenizerInfo(vocab, vocab_size=64)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info(json_grammar, tokenizer_info)
+
+    token_bitmask = xgr.allocate_token_bitmask(2, tokenizer_info.vocab_size)
+    token_bitmask_cuda = token_bitmask.to("cuda")
+    for token_id in [7, 5, 2, 5, 11, 10, 8]:
+        need_apply = matcher.fill_next_token_bitmask(token_bitmask, 1)
+        need_apply_cuda = matcher.fill_next_token_bitmask(token_bitmask_cuda, 1)
+        assert need_apply == need_apply_cuda
+        torch.testing.assert_close(token_bitmask_cuda.cpu(), token_bitmask)
+        assert matcher.accept_token(token_id)
+
+
+def test_fill_next_token_bitmask_pinned():
+    if not torch.cuda.is_available():
+        pytest.skip(reason="CUDA is not installed")
+
+    vocab = [
+        # fmt: off
+        "<s>", "</s>", "a", "abc", 'b"', '"', ':"', "{", "}", ", ", "6", ":", "\n", " ", '"a":true',
+        # fmt: on
+    ]
+    tokenizer_info = xgr.TokenizerInfo(vocab, vocab_size=64)
+    matcher = _get_matcher_from_grammar_and_tokenizer_info(json_grammar, tokenizer_info)
+
+    token_bitmask = xgr.allocate_token_bitmask(1, tokenizer_info.vocab_size)
+    for token_id in [7, 5, 2, 5, 11, 10, 8]:
+        need_apply = matcher.fill_next_token_bitmask(token_bitmask)
+        pinned_bitmask, need_apply_pinned = matcher.fill_next_token_bitmask_pinned()
+        assert pinned_bitmask.is_pinned()
+        assert need_apply == need_apply_pinned
+        torch.testing.assert_close(pinned_bitmask, token_bitmask[0])
+        assert matcher.accept_token(token_id)
+
+
+def test_fill_next_token_bitmask_pinned_no_cuda():
+    if torch.cuda.is_available():
+        pytest.skip(reason="CUDA is installed")
+
+    tokenizer_info = xgr.TokenizerInfo(["a", "b"])
+    matcher = _get_matcher_from_grammar_and_tokenizer_info('root ::= "a"', tokenizer_info)
+    with pytest.raises(ValueError):
+        matcher.fill_next_token_bitmask_pinned()
+
+
 tokenizer_path_override_stop_tokens = [
     ("meta-llama/Llama-2-7b-chat-hf", [2]),
     ("meta-llama/Meta-Llama-3-8B-Instruct", [128001, 128009]),
@@ -143,6 +143,28 @@ def test_apply_token_bitmask_inplace_kernel(impl: str):
         torch.testing.assert_close(logits, expected)
 
 
+def test_apply_token_bitmask_inplace_cuda_fullgraph():
+    if not _is_cuda_available:
+        pytest.skip(reason="CUDA is not installed")
+
+    kernel = get_apply_token_bitmask_kernel("cuda")
+
+    # The op mutates logits, so the compiled graph must read logits after the kernel
+    @torch.compile(fullgraph=True)
+    def mask_and_softmax(logits: torch.Tensor, bitmask: torch.Tensor) -> torch.Tensor:
+        kernel(logits, bitmask)
+        return torch.softmax(logits, dim=-1)
+
+    bool_mask = torch.tensor([0, 1, 0, 1, 0, 1, 0, 1, 0, 1], dtype=torch.bool)
+    logits = torch.randn(1, 10, dtype=torch.float32)
+    expected = torch.softmax(torch.where(bool_mask, logits, float("-inf")), dim=-1)
+
+    logits_gpu = logits.to("cuda")
+    bitmask = _bool_mask_to_bitmask(bool_mask.unsqueeze(0)).to("cuda")
+    result = mask_and_softmax(logits_gpu, bitmask)
+    torch.testing.assert_close(result, expected.to("cuda"))
+
+
 batch_size__vocab_size__masked_cnt__stride__logits_dtype = [
     (1, 128000, 1024, 1, "float32"),
     (1, 128000, 120000, 1, "float32"),
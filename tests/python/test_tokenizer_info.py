@@ -8,12 +8,38 @@ from transformers import AutoTokenizer, PreTrainedTokenizerBase
 import xgrammar as xgr
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def tokenizer_info_storage() -> Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]]:
-    """Mapping from the tokenizer path to the huggingface tokenizer and XGrammar tokenizer info."""
+    """Mapping from the tokenizer path to the huggingface tokenizer and XGrammar tokenizer info.
+    Shared by all tests so that each tokenizer is only loaded once."""
     return {}
 
 
+def _get_tokenizer_and_info(
+    tokenizer_path: str,
+    tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
+) -> Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]:
+    """Get the tokenizer and the tokenizer info from the storage, loading them if not present."""
+    if tokenizer_path not in tokenizer_info_storage:
+        tokenizer = AutoTokenizer.from_pretrained(
+            tokenizer_path, use_fast=True, trust_remote_code=True
+        )
+        tokenizer_info = xgr.TokenizerInfo.from_huggingface(tokenizer)
+        tokenizer_info_storage[tokenizer_path] = (tokenizer, tokenizer_info)
+    return tokenizer_info_storage[tokenizer_path]
+
+
+def _group_by_tokenizer(params: List) -> List:
+    """Put each test param into the xdist group of its tokenizer path, i.e. the param itself or
+    its first element. With --dist loadgroup, the tests of one tokenizer then run on one worker and
+    load it once, while different tokenizers are loaded in parallel."""
+    grouped = []
+    for param in params:
+        values = param if isinstance(param, tuple) else (param,)
+        grouped.append(pytest.param(*values, marks=pytest.mark.xdist_group(values[0])))
+    return grouped
+
+
 tokenizer_path__vocab_type__prepend_space = [
     ("luodian/llama-7b-hf", xgr.VocabType.BYTE_FALLBACK, True),
     ("meta-llama/Llama-2-7b-chat-hf", xgr.VocabType.BYTE_FALLBACK, True),
@@ -51,19 +77,19 @@ tokenizer_paths = [path for path, *_ in tokenizer_path__vocab_type__prepend_spac
 
 
 @pytest.mark.hf_token_required
-@pytest.mark.parametrize("tokenizer_path", tokenizer_paths)
+@pytest.mark.parametrize("tokenizer_path", _group_by_tokenizer(tokenizer_paths))
 def test_build_tokenizer_info(
     tokenizer_path: str,
     tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
 ):
-    tokenizer = AutoTokenizer.from_pretrained(tokenizer_path, use_fast=True, trust_remote_code=True)
-    tokenizer_info = xgr.TokenizerInfo.from_huggingface(tokenizer)
-    tokenizer_info_storage[tokenizer_path] = (tokenizer, tokenizer_info)
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
+    assert tokenizer_info.vocab_size > 0
 
 
 @pytest.mark.hf_token_required
 @pytest.mark.parametrize(
-    "tokenizer_path, vocab_type, add_prefix_space", tokenizer_path__vocab_type__prepend_space
+    "tokenizer_path, vocab_type, add_prefix_space",
+    _group_by_tokenizer(tokenizer_path__vocab_type__prepend_space),
 )
 def test_properties(
     tokenizer_path: str,
@@ -71,7 +97,7 @@ def test_properties(
     add_prefix_space: bool,
     tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
 ):
-    tokenizer, tokenizer_info = tokenizer_info_storage[tokenizer_path]
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     vocab_dict = tokenizer.get_vocab()
     max_id = max(vocab_dict.values()) if vocab_dict else -1
     assert tokenizer_info.vocab_size == max(len(vocab_dict), max_id + 1)
@@ -80,12 +106,12 @@ def test_properties(
 
 
 @pytest.mark.hf_token_required
-@pytest.mark.parametrize("tokenizer_path", tokenizer_paths)
+@pytest.mark.parametrize("tokenizer_path", _group_by_tokenizer(tokenizer_paths))
 def test_decoded_vocab(
     tokenizer_path: str,
     tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
 ):
-    tokenizer, tokenizer_info = tokenizer_info_storage[tokenizer_path]
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     decoded_vocab = tokenizer_info.decoded_vocab
     vocab_dict = tokenizer.get_vocab()
     max_id = max(vocab_dict.values()) if vocab_dict else -1
@@ -96,12 +122,12 @@ def test_decoded_vocab(
 
 
 @pytest.mark.hf_token_required
-@pytest.mark.parametrize("tokenizer_path", tokenizer_paths)
+@pytest.mark.parametrize("tokenizer_path", _group_by_tokenizer(tokenizer_paths))
 def test_stop_token_ids(
     tokenizer_path: str,
     tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
 ):
-    tokenizer, tokenizer_info = tokenizer_info_storage[tokenizer_path]
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     if hasattr(tokenizer, "eos_token_id") and tokenizer.eos_token_id is not None:
         assert tokenizer_info.stop_token_ids == [tokenizer.eos_token_id]
     else:
@@ -109,7 +135,7 @@ def test_stop_token_ids(
 
 
 @pytest.mark.hf_token_required
-@pytest.mark.parametrize("tokenizer_path", tokenizer_paths)
+@pytest.mark.parametrize("tokenizer_path", _group_by_tokenizer(tokenizer_paths))
 def test_decode_text(
     tokenizer_path: str,
     tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
@@ -119,7 +145,7 @@ def test_decode_text(
         + "αβγδ АБВГД عربي עברית"
         + "\n\t\r Special chars: &*()_+-=[]{}|;:'\",.<>?/\\~`!@#$%^<think>haha</think>"
     )
-    tokenizer, tokenizer_info = tokenizer_info_storage[tokenizer_path]
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     decoded_vocab = tokenizer_info.decoded_vocab
     tokenized_text = tokenizer.encode(text)
 
@@ -160,11 +186,16 @@ tokenizer_path__token_ids__raw_tokens = [
 
 @pytest.mark.hf_token_required
 @pytest.mark.parametrize(
-    "tokenizer_path, token_ids, raw_tokens", tokenizer_path__token_ids__raw_tokens
+    "tokenizer_path, token_ids, raw_tokens",
+    _group_by_tokenizer(tokenizer_path__token_ids__raw_tokens),
 )
-def test_vocab_conversion(tokenizer_path: str, token_ids: List[int], raw_tokens: List[bytes]):
-    tokenizer = AutoTokenizer.from_pretrained(tokenizer_path, use_fast=True, trust_remote_code=True)
-    tokenizer_info = xgr.TokenizerInfo.from_huggingface(tokenizer)
+def test_vocab_conversion(
+    tokenizer_path: str,
+    token_ids: List[int],
+    raw_tokens: List[bytes],
+    tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
+):
+    _, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     vocab = tokenizer_info.decoded_vocab
     for token_id, raw_token in zip(token_ids, raw_tokens):
         assert vocab[token_id] == raw_token
@@ -187,10 +218,15 @@ tokenizer_path__metadata_str = [
 
 
 @pytest.mark.hf_token_required
-@pytest.mark.parametrize("tokenizer_path, metadata_str", tokenizer_path__metadata_str)
-def test_dump_metadata_load(tokenizer_path: str, metadata_str: str):
-    tokenizer = AutoTokenizer.from_pretrained(tokenizer_path, use_fast=True, trust_remote_code=True)
-    tokenizer_info = xgr.TokenizerInfo.from_huggingface(tokenizer)
+@pytest.mark.parametrize(
+    "tokenizer_path, metadata_str", _group_by_tokenizer(tokenizer_path__metadata_str)
+)
+def test_dump_metadata_load(
+    tokenizer_path: str,
+    metadata_str: str,
+    tokenizer_info_storage: Dict[str, Tuple[PreTrainedTokenizerBase, xgr.TokenizerInfo]],
+):
+    tokenizer, tokenizer_info = _get_tokenizer_and_info(tokenizer_path, tokenizer_info_storage)
     assert tokenizer_info.dump_metadata() == metadata_str
 
     encoded_vocab = tokenizer.get_vocab()
@@ -229,7 +265,7 @@ def test_customize_stop_token_ids(tokenizer_path: str):
 )
 def test_padding_vocab_size(tokenizer_path: str):
     tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
-    original_vocab_size = len(tokenizer.get_vocab())
+    original_vocab_size = len(tokenizer)
     tokenizer_info = xgr.TokenizerInfo.from_huggingface(
         tokenizer, vocab_size=original_vocab_size + 5
     )
@@ -248,7 +284,7 @@ tokenizer_path__model_vocab_size = [
 @pytest.mark.parametrize("tokenizer_path, model_vocab_size", tokenizer_path__model_vocab_size)
 def test_model_vocab_size_smaller_than_tokenizer(tokenizer_path: str, model_vocab_size: int):
     tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
-    original_vocab_size = len(tokenizer.get_vocab())
+    original_vocab_size = len(tokenizer)
     assert original_vocab_size > model_vocab_size
     tokenizer_info = xgr.TokenizerInfo.from_huggingface(tokenizer, vocab_size=model_vocab_size)
     assert tokenizer_info.vocab_size == model_vocab_size
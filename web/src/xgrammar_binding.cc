@@ -166,7 +166,10 @@ EMSCRIPTEN_BINDINGS(xgrammar) {
       .constructor<const TokenizerInfo&, int, bool>()
       .function("CompileJSONSchema", &GrammarCompiler::CompileJSONSchema)
       .function("CompileBuiltinJSONGrammar", &GrammarCompiler::CompileBuiltinJSONGrammar)
-      .function("CompileGrammar", &GrammarCompiler::CompileGrammar)
+      .function(
+          "CompileGrammar",
+          select_overload<CompiledGrammar(const Grammar&)>(&GrammarCompiler::CompileGrammar)
+      )
       .function("ClearCache", &GrammarCompiler::ClearCache);
 
   class_<GrammarMatcher>("GrammarMatcher")